@@ -1,14 +1,26 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from win32com.shell import shellcon
+import functools
+import hashlib
+import os
 import signal
+import socket
 import subprocess
 import sys
+import tempfile
+import threading
 import time
-import win32com.shell.shell as shell
-
-from PySide6.QtCore import Qt, QTimer, QUrl, QSize, QObject, Signal, QPropertyAnimation, QEasingCurve, QPoint
-from PySide6.QtGui import QPixmap, QAction, QIcon, QDrag, QGuiApplication
+import pywintypes
+import win32con
+import win32file
+import winerror
+
+from PySide6.QtCore import (
+    Qt, QTimer, QUrl, QSize, QObject, Signal, QPropertyAnimation, QEasingCurve, QPoint, QRunnable, QThreadPool,
+    QSocketNotifier, QMimeData,
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QImage, QImageReader, QAction, QIcon, QDrag, QGuiApplication
 from PySide6.QtWidgets import (
     QApplication,
     QWidget,
@@ -18,17 +30,129 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-
 
 IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp"}
 
+# Scaled thumbnails are cached on disk so repeat previews skip the full decode.
+THUMB_CACHE_DIR = Path(tempfile.gettempdir()) / "screenshot_preview_cache"
+THUMB_CACHE_MAX_BYTES = 200 * 1024 * 1024
+THUMB_CACHE_EVICT_EVERY = 20  # run an eviction pass every N cache writes
+PIXMAP_CACHE_LIMIT_KB = 32 * 1024  # in-memory QPixmapCache in front of the disk cache
+
 
 def default_screenshots_dir() -> Path:
+    # Imported lazily to keep COM initialisation off the startup path
+    from win32com.shell import shellcon
+    import win32com.shell.shell as shell
     return Path(shell.SHGetKnownFolderPath(shellcon.FOLDERID_Screenshots))
 
 
+def thumb_cache_path(file_path: str, max_size: int) -> Path | None:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    key = hashlib.blake2b(
+        f"{file_path}|{st.st_mtime_ns}|{st.st_size}|{max_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return THUMB_CACHE_DIR / f"{key}.png"
+
+
+def evict_thumb_cache(max_bytes: int = THUMB_CACHE_MAX_BYTES) -> None:
+    """
+    Drop the least recently used thumbnails once the cache exceeds max_bytes.
+    """
+    entries = []
+    for path in THUMB_CACHE_DIR.glob("*.png"):
+        try:
+            entries.append((path, path.stat()))
+        except OSError:
+            continue
+
+    entries.sort(key=lambda entry: entry[1].st_atime, reverse=True)
+    total = 0
+    for path, st in entries:
+        total += st.st_size
+        if total > max_bytes:
+            # May still be open in a ThumbTask; leave it for the next pass
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+
+
+def scale_thumbnail(file_path: str, max_size: int) -> QImage:
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+
+    # libjpeg can scale during decode (DCT scaling), so JPEGs are decoded straight
+    # to the thumbnail size. Other handlers that report ScaledSize (e.g. PNG) just
+    # decode in full and smooth-scale internally, so they take the path below.
+    orig = reader.size()
+    if orig.isValid() and bytes(reader.format()) in (b"jpeg", b"jpg"):
+        scale = min(max_size / orig.width(), max_size / orig.height())
+        if scale < 1:
+            reader.setScaledSize(QSize(int(orig.width() * scale), int(orig.height() * scale)))
+            return reader.read()
+
+    img = reader.read()
+    if img.isNull():
+        return img
+
+    # Calculate scaled size while respecting max dimension
+    orig_width = img.width()
+    orig_height = img.height()
+
+    # Scale to fit within max_size, scaling up if smaller
+    scale = min(max_size / orig_width, max_size / orig_height)
+    new_width = int(orig_width * scale)
+    new_height = int(orig_height * scale)
+
+    # Large sources: a cheap nearest-neighbour pass down to ~4x the target so
+    # the smooth filter only runs over a small buffer
+    if scale < 0.25:
+        img = img.scaled(new_width * 4, new_height * 4, Qt.KeepAspectRatio, Qt.FastTransformation)
+
+    # Qt's smooth scaling has its fast paths for these formats. PNG screenshots
+    # typically decode to ARGB32; converting the reduced buffer once here avoids
+    # per-pixel (de)premultiplication inside the filter
+    if img.hasAlphaChannel():
+        img = img.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    else:
+        img = img.convertToFormat(QImage.Format.Format_RGB32)
+
+    # Scale the image to the calculated size
+    return img.scaled(new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def load_thumbnail(file_path: str, max_size: int) -> tuple[QImage, bool]:
+    """
+    Return the scaled thumbnail for file_path, and whether it was newly written
+    to the disk cache.
+    """
+    cache_path = thumb_cache_path(file_path, max_size)
+    if cache_path:
+        cached = QImage(str(cache_path))
+        if not cached.isNull():
+            # Refresh the access time so eviction keeps recently shown thumbnails
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return cached, False
+
+    image = scale_thumbnail(file_path, max_size)
+    if not cache_path or image.isNull():
+        return image, False
+
+    try:
+        THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return image, False
+    return image, image.save(str(cache_path), "PNG")
+
+
 def open_explorer_and_select(file_path: str) -> None:
     print(f"Opening explorer for file: {file_path}")
     subprocess.Popen(["explorer.exe", "/select,", file_path], shell=False)
@@ -36,67 +160,168 @@ def open_explorer_and_select(file_path: str) -> None:
 
 @dataclass
 class AppConfig:
-    watch_dir: Path
+    watch_dir: Path | None = None  # None: the Screenshots known folder, resolved on first use
     popup_seconds: int = 5
     max_preview_size: int = 220  # px thumbnail max side
 
 
 class UiBridge(QObject):
     file_created = Signal(str)
+    file_pending = Signal()
+
 
+class ThumbSignals(QObject):
+    finished = Signal(str, QImage, bool)  # file path, thumbnail, newly cached
 
-class ScreenshotHandler(FileSystemEventHandler):
+
+class ThumbTask(QRunnable):
     """
-    Watchdog runs in a background thread; emit signals into Qt safely via UiBridge.
+    Loads a thumbnail on a QThreadPool worker. QPixmap is GUI-thread only, so the
+    result is delivered as a QImage through ThumbSignals.
     """
-    def __init__(self, bridge: UiBridge, watch_dir: Path):
+    def __init__(self, file_path: str, max_size: int, signals: ThumbSignals):
         super().__init__()
-        self.bridge = bridge
-        self.watch_dir = watch_dir
+        self.file_path = file_path
+        self.max_size = max_size
+        self.signals = signals
 
-    def on_created(self, event):
-        if event.is_directory:
-            return
-        path = Path(event.src_path)
-        if path.suffix.lower() not in IMAGE_EXTS:
-            return
+    def run(self):
+        image, stored = load_thumbnail(self.file_path, self.max_size)
+        self.signals.finished.emit(self.file_path, image, stored)
 
-        # Some screenshot tools create then write; wait for file to become stable.
-        if self._wait_for_stable_file(path):
-            self.bridge.file_created.emit(str(path))
 
-    @staticmethod
-    def _wait_for_stable_file(path: Path, timeout_s: float = 2.5) -> bool:
-        start = time.time()
-        last_size = -1
-        while time.time() - start < timeout_s:
+@functools.cache
+def screenshot_handler_class() -> type:
+    """
+    Define ScreenshotHandler on first use so watchdog is only imported once the
+    tray icon is up.
+    """
+    from watchdog.events import PatternMatchingEventHandler
+
+    class ScreenshotHandler(PatternMatchingEventHandler):
+        """
+        Watchdog runs in a background thread; emit signals into Qt safely via UiBridge.
+
+        Some screenshot tools create then write, so new files are only recorded here.
+        A UI-thread timer reports them once the writer has closed the file.
+        """
+        TIMEOUT_S = 2.5
+
+        def __init__(self, bridge: UiBridge, watch_dir: Path, is_paused: Callable[[], bool]):
+            # Non-image files and directories are filtered out before dispatch
+            super().__init__(
+                patterns=[f"*{ext}" for ext in sorted(IMAGE_EXTS)],
+                ignore_directories=True,
+                case_sensitive=False,
+            )
+            self.bridge = bridge
+            self.watch_dir = watch_dir
+            self.is_paused = is_paused
+
+            # path -> first seen, shared with the watchdog thread
+            self._pending: dict[str, float] = {}
+            self._pending_lock = threading.Lock()
+
+            # Only runs while files are pending; started from the watchdog thread
+            # through a queued signal
+            self._settle_timer = QTimer()
+            self._settle_timer.setInterval(50)
+            self._settle_timer.timeout.connect(self._check_pending)
+            self.bridge.file_pending.connect(self._start_settle_timer)
+
+        def _start_settle_timer(self):
+            # Restarting would push the next check back on every new file in a burst
+            if not self._settle_timer.isActive():
+                self._settle_timer.start()
+
+        def on_created(self, event):
+            if self.is_paused():
+                return
+            with self._pending_lock:
+                self._pending[event.src_path] = time.monotonic()
+            self.bridge.file_pending.emit()
+
+        def _check_pending(self):
+            now = time.monotonic()
+            ready = []
+            with self._pending_lock:
+                for path, first_seen in list(self._pending.items()):
+                    done = self._writer_done(path)
+                    if done is None:
+                        del self._pending[path]
+                    elif done or now - first_seen >= self.TIMEOUT_S:  # best effort on timeout
+                        del self._pending[path]
+                        ready.append(path)
+
+                if not self._pending:
+                    self._settle_timer.stop()
+
+            if self.is_paused():
+                return
+            for path in ready:
+                self.bridge.file_created.emit(path)
+
+        @staticmethod
+        def _writer_done(path: str) -> bool | None:
+            """
+            Probe the file without sharing write access: this fails with a sharing
+            violation for as long as the writer keeps its handle open.
+
+            Returns True once the file is closed and non-empty, False while it is still
+            being written, and None if it cannot be opened at all (e.g. deleted).
+            """
             try:
-                size = path.stat().st_size
-                if size > 0 and size == last_size:
-                    return True
-                last_size = size
-            except FileNotFoundError:
-                return False
-            time.sleep(0.08)
-        return True  # best effort
+                handle = win32file.CreateFile(
+                    path,
+                    win32con.GENERIC_READ,
+                    win32con.FILE_SHARE_READ,
+                    None,
+                    win32con.OPEN_EXISTING,
+                    0,
+                    None,
+                )
+            except pywintypes.error as e:
+                if e.winerror == winerror.ERROR_SHARING_VIOLATION:
+                    return False
+                return None
+            try:
+                return win32file.GetFileSize(handle) > 0
+            finally:
+                handle.Close()
+
+    return ScreenshotHandler
 
 
 class PreviewPopup(QWidget):
     def __init__(self, config: AppConfig):
         super().__init__()
         self.config = config
-        self.current_file: str | None = None
+        self.current_file: str | None = None  # file whose thumbnail is on screen
+        self._loading_file: str | None = None  # file whose thumbnail is being loaded
+        self._pixmap_key: str | None = None  # QPixmapCache key for _loading_file
+        self._current_pixmap: QPixmap | None = None  # shown thumbnail, reused as drag pixmap
+        self._cached_urls: tuple[str, list[QUrl]] | None = None  # drag URLs for current_file
 
         # Click vs drag handling
         self._press_pos = None
         self._drag_started = False
 
-        # Animation attributes
-        self._slide_in_animation: QPropertyAnimation | None = None
-        self._slide_out_animation: QPropertyAnimation | None = None
+        # Animation attributes; the animations are reused for every popup
+        self._slide_in_animation = QPropertyAnimation(self, b"pos")
+        self._slide_in_animation.setDuration(500)  # 500ms
+        self._slide_in_animation.setEasingCurve(QEasingCurve.Type.OutBack)
+        self._slide_out_animation = QPropertyAnimation(self, b"pos")
+        self._slide_out_animation.setDuration(400)  # 400ms
+        self._slide_out_animation.setEasingCurve(QEasingCurve.Type.InBack)
+        self._slide_out_animation.finished.connect(self._hide_after_animation)
         self._target_pos: QPoint | None = None
         self._is_animating_out = False
 
+        # Thumbnail loading runs on QThreadPool workers
+        self._thumb_signals = ThumbSignals()
+        self._thumb_signals.finished.connect(self._on_thumb_ready)
+        self._thumb_cache_writes = 0  # since the last eviction pass
+
         self.setWindowFlags(
             Qt.Tool
             | Qt.FramelessWindowHint
@@ -128,7 +353,7 @@ class PreviewPopup(QWidget):
 
         self.hide_timer = QTimer(self)
         self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self.hide)
+        self.hide_timer.timeout.connect(self.dismiss)
 
         self.setMouseTracking(True)
         self.container.setMouseTracking(True)
@@ -138,44 +363,86 @@ class PreviewPopup(QWidget):
         window_size = self.config.max_preview_size + 24
         self.resize(window_size, window_size)
 
+        # Cache screen metrics; refreshed only when the screen setup changes
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._cache_geo)
+        app.primaryScreenChanged.connect(self._watch_primary_screen)
+        self._watch_primary_screen(QGuiApplication.primaryScreen())
+
+    def _watch_primary_screen(self, screen):
+        screen.availableGeometryChanged.connect(self._cache_geo)
+        self._cache_geo()
+
+    def _cache_geo(self, *_):
+        self._avail_geo = QGuiApplication.primaryScreen().availableGeometry()
+
     def show_preview(self, file_path: str):
-        self.current_file = file_path
+        # current_file only changes once the new thumbnail is shown, so clicks and
+        # drags until then still act on the screenshot the user can see
+        self._loading_file = file_path
+
+        try:
+            st = os.stat(file_path)
+            self._pixmap_key = f"{file_path}:{st.st_mtime_ns}:{self.config.max_preview_size}"
+        except OSError:
+            self._pixmap_key = None
+
+        if self._pixmap_key:
+            pm = QPixmapCache.find(self._pixmap_key)
+            if pm is not None and not pm.isNull():
+                self._show_thumb(file_path, pm)
+                return
+
+        # Decode and scale off the GUI thread; _on_thumb_ready shows the result
+        task = ThumbTask(file_path, self.config.max_preview_size, self._thumb_signals)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_thumb_ready(self, file_path: str, image: QImage, stored: bool):
+        if stored:
+            self._thumb_cache_writes += 1
+            if self._thumb_cache_writes >= THUMB_CACHE_EVICT_EVERY:
+                self._thumb_cache_writes = 0
+                QThreadPool.globalInstance().start(evict_thumb_cache)
+
+        # A newer screenshot arrived while this one was decoding
+        if file_path != self._loading_file:
+            return
+
+        if image.isNull():
+            self._show_thumb(file_path, None)
+            return
+
+        scaled = QPixmap.fromImage(image)
+        if self._pixmap_key:
+            QPixmapCache.insert(self._pixmap_key, scaled)
+        self._show_thumb(file_path, scaled)
 
-        pix = QPixmap(file_path)
-        if pix.isNull():
+    def _show_thumb(self, file_path: str, scaled: QPixmap | None):
+        self._loading_file = None
+        self.current_file = file_path
+        self._cached_urls = None
+        self._current_pixmap = scaled
+        if scaled is None:
             # fallback: show filename only
             self.thumb.setText("Preview unavailable")
         else:
-            # Calculate scaled size while respecting max dimension
-            orig_width = pix.width()
-            orig_height = pix.height()
-            max_size = self.config.max_preview_size
-
-            # Scale to fit within max_size, scaling up if smaller
-            scale = min(max_size / orig_width, max_size / orig_height)
-            new_width = int(orig_width * scale)
-            new_height = int(orig_height * scale)
-
-            # Scale the pixmap to the calculated size
-            scaled = pix.scaled(new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             self.thumb.setPixmap(scaled)
 
             # Resize thumbnail label and window to match the image dimensions
-            self.thumb.setFixedSize(new_width, new_height)
-            self.resize(new_width + 24, new_height + 24)  # add margins
+            self.thumb.setFixedSize(scaled.width(), scaled.height())
+            self.resize(scaled.width() + 24, scaled.height() + 24)  # add margins
 
         self._animate_in()
 
     def _animate_in(self):
         # Cancel any ongoing animations
-        if self._slide_out_animation and self._slide_out_animation.state() == QPropertyAnimation.Running:
+        if self._slide_out_animation.state() == QPropertyAnimation.Running:
             self._slide_out_animation.stop()
-        if self._slide_in_animation and self._slide_in_animation.state() == QPropertyAnimation.Running:
+        if self._slide_in_animation.state() == QPropertyAnimation.Running:
             self._slide_in_animation.stop()
 
         # Calculate target position
-        screen = QGuiApplication.primaryScreen()
-        geo = screen.availableGeometry()
+        geo = self._avail_geo
         margin = 24
         target_x = geo.x() + geo.width() - self.width() - margin
         target_y = geo.y() + geo.height() - self.height() - margin
@@ -187,17 +454,13 @@ class PreviewPopup(QWidget):
         self.move(start_pos)
         self._is_animating_out = False
 
-        # Show the window
+        # Show the window without taking focus from the active app
         self.show()
         self.raise_()
-        self.activateWindow()
 
-        # Create slide-in animation
-        self._slide_in_animation = QPropertyAnimation(self, b"pos")
-        self._slide_in_animation.setDuration(500)  # 500ms
+        # Run slide-in animation
         self._slide_in_animation.setStartValue(start_pos)
         self._slide_in_animation.setEndValue(self._target_pos)
-        self._slide_in_animation.setEasingCurve(QEasingCurve.Type.OutBack)
         self._slide_in_animation.start()
 
         # Start hide timer
@@ -209,34 +472,28 @@ class PreviewPopup(QWidget):
         self._is_animating_out = True
 
         # Cancel any ongoing animations
-        if self._slide_in_animation and self._slide_in_animation.state() == QPropertyAnimation.Running:
+        if self._slide_in_animation.state() == QPropertyAnimation.Running:
             self._slide_in_animation.stop()
 
         # Calculate end position (off-screen to the right)
-        screen = QGuiApplication.primaryScreen()
-        geo = screen.availableGeometry()
+        geo = self._avail_geo
         end_x = geo.x() + geo.width() + self.width()
         end_pos = QPoint(end_x, self._target_pos.y() if self._target_pos else self.y())
 
-        # Create slide-out animation
-        self._slide_out_animation = QPropertyAnimation(self, b"pos")
-        self._slide_out_animation.setDuration(400)  # 400ms
+        # Run slide-out animation
         self._slide_out_animation.setStartValue(self.pos())
         self._slide_out_animation.setEndValue(end_pos)
-        self._slide_out_animation.setEasingCurve(QEasingCurve.Type.InBack)
-        self._slide_out_animation.finished.connect(self._hide_after_animation)
         self._slide_out_animation.start()
 
     def _hide_after_animation(self):
-        super(PreviewPopup, self).hide()
+        self.hide()
         self._is_animating_out = False
 
-    def hide(self):
+    def dismiss(self):
         self._animate_out()
 
     def _move_to_bottom_right(self):
-        screen = QGuiApplication.primaryScreen()
-        geo = screen.availableGeometry()
+        geo = self._avail_geo
         margin = 24
         x = geo.x() + geo.width() - self.width() - margin
         y = geo.y() + geo.height() - self.height() - margin
@@ -248,7 +505,7 @@ class PreviewPopup(QWidget):
             self._press_pos = event.position().toPoint()
             self._drag_started = False
         elif event.button() == Qt.RightButton:
-            self.hide()
+            self.dismiss()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
@@ -268,17 +525,18 @@ class PreviewPopup(QWidget):
 
         self._drag_started = True
 
-        mime = QGuiApplication.clipboard().mimeData()
-        # Use QMimeData with file URL for proper file DnD to browser
-        from PySide6.QtCore import QMimeData
+        # Use QMimeData with file URL for proper file DnD to browser.
+        # QDrag owns and deletes its QMimeData, so only the URL list is reused.
+        if not self._cached_urls or self._cached_urls[0] != self.current_file:
+            self._cached_urls = (self.current_file, [QUrl.fromLocalFile(self.current_file)])
         md = QMimeData()
-        md.setUrls([QUrl.fromLocalFile(self.current_file)])
+        md.setUrls(self._cached_urls[1])
 
         drag = QDrag(self)
         drag.setMimeData(md)
 
         # Use thumbnail as drag pixmap
-        pm = self.thumb.pixmap()
+        pm = self._current_pixmap
         if pm:
             drag.setPixmap(pm)
             drag.setHotSpot(pm.rect().center())
@@ -292,7 +550,7 @@ class PreviewPopup(QWidget):
             # If no drag started, treat as click
             if not self._drag_started:
                 open_explorer_and_select(self.current_file)
-                self.hide()
+                self.dismiss()
         self._press_pos = None
         self._drag_started = False
         super().mouseReleaseEvent(event)
@@ -330,9 +588,25 @@ class TrayApp:
         self._paused = False
         self._observer = None
 
+        # Coalesce bursts of new files so only the last one drives the popup
+        self._pending_file: str | None = None
+        self._debounce = QTimer()
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(120)
+        self._debounce.timeout.connect(self._flush_pending)
+
+    def watch_dir(self) -> Path:
+        if self.config.watch_dir is None:
+            self.config.watch_dir = default_screenshots_dir()
+        return self.config.watch_dir
+
     def open_folder(self):
-        self.config.watch_dir.mkdir(parents=True, exist_ok=True)
-        subprocess.Popen(["explorer.exe", str(self.config.watch_dir)], shell=False)
+        watch_dir = self.watch_dir()
+        watch_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.Popen(["explorer.exe", str(watch_dir)], shell=False)
+
+    def is_paused(self) -> bool:
+        return self._paused
 
     def toggle_pause(self):
         self._paused = not self._paused
@@ -345,23 +619,40 @@ class TrayApp:
         print("Detected:", file_path)
         if self._paused:
             return
-        self.popup.show_preview(file_path)
+        self._pending_file = file_path
+        self._debounce.start()
+
+    def _flush_pending(self):
+        file_path, self._pending_file = self._pending_file, None
+        if file_path:
+            self.popup.show_preview(file_path)
 
     def start_watching(self):
-        self.config.watch_dir.mkdir(parents=True, exist_ok=True)
-        handler = ScreenshotHandler(self.bridge, self.config.watch_dir)
+        from watchdog.observers import Observer
+
+        watch_dir = self.watch_dir()
+        watch_dir.mkdir(parents=True, exist_ok=True)
+        handler = screenshot_handler_class()(self.bridge, watch_dir, self.is_paused)
         obs = Observer()
-        obs.schedule(handler, str(self.config.watch_dir), recursive=False)
+        obs.schedule(handler, str(watch_dir), recursive=False)
         obs.daemon = True
         obs.start()
         self._observer = obs
 
+    def stop_watching(self):
+        if self._observer is None:
+            return
+        # Cancels the pending ReadDirectoryChangesW so the watcher threads exit
+        self._observer.stop()
+        self._observer.join(timeout=1)
+        self._observer = None
+
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Screenshot folder monitor with preview popup")
-    parser.add_argument("--watch-dir", type=Path, default=default_screenshots_dir(),
-                        help="Directory to watch for new screenshots")
+    parser.add_argument("--watch-dir", type=Path, default=None,
+                        help="Directory to watch for new screenshots (default: the Screenshots known folder)")
     parser.add_argument("--popup-seconds", type=int, default=5,
                         help="Seconds to show the preview popup")
     parser.add_argument("--max-preview-size", type=int, default=220,
@@ -370,19 +661,30 @@ def main():
 
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
 
     # Handle Ctrl+C to quit the application gracefully
-    # On Windows, we need a timer to periodically wake up the interpreter
-    # so it can process signals
+    # Python only runs signal handlers when it regains control, so have the C
+    # handler write to a socket that the Qt event loop watches
     def handle_sigint(sig, frame):
         print("Exiting...")
         app.quit()
     signal.signal(signal.SIGINT, handle_sigint)
-    
-    # Timer to allow Python to process signals in the Qt event loop
-    signal_timer = QTimer()
-    signal_timer.timeout.connect(lambda: None)
-    signal_timer.start(100)  # 100ms interval
+
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+
+    def drain_wakeup_socket():
+        # Running any Python code here lets the interpreter call handle_sigint
+        try:
+            while rsock.recv(4096):
+                pass
+        except OSError:
+            pass
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read)
+    notifier.activated.connect(drain_wakeup_socket)
 
     config = AppConfig(
         watch_dir=args.watch_dir,
@@ -390,7 +692,10 @@ def main():
         max_preview_size=args.max_preview_size
     )
     tray_app = TrayApp(config)
-    tray_app.start_watching()
+    # Start watchdog (and resolve the default folder) once the event loop is
+    # running so the tray icon shows first
+    QTimer.singleShot(0, tray_app.start_watching)
+    app.aboutToQuit.connect(tray_app.stop_watching)
 
     sys.exit(app.exec())
 